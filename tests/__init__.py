@@ -7,17 +7,29 @@ Tests for the ``smd`` application.
 '''
 import argparse
 from io import StringIO
+import functools
 import logging
 import os
 import shutil
 import sys
+import tempfile
 import typing
 import unittest
 
 import smd
 
+try:
+    # faster parsing of the fixtures, if available
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    import json
+
+    def json_loads(data: bytes) -> 'Any':
+        # json.loads accepts bytes only since Python 3.6
+        return json.loads(data.decode())
+
 if typing.TYPE_CHECKING:
-    from typing import List, TextIO
+    from typing import Any, List, TextIO
 
 
 def gettext(msg: str) -> str:
@@ -25,17 +37,62 @@ def gettext(msg: str) -> str:
 
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
-TEST_DIR = os.path.join(os.path.dirname(ROOT), 'test_smd_temp')
 DATA_DIR = os.path.join(ROOT, 'data', 'smd')
+TEST_DIR = None  # type: str
 
 
 def setUpModule() -> None:
-    os.mkdir(TEST_DIR)
+    global TEST_DIR
+    TEST_DIR = make_test_dir('smd_test_')
     smd._ = smd.downloader._ = smd.utils._ = gettext
 
 
 def tearDownModule() -> None:
-    shutil.rmtree(TEST_DIR)
+    remove_test_dir(TEST_DIR)
+
+
+def make_test_dir(prefix: str) -> str:
+    """Creates the temporary folder used by a test module.
+
+    :param prefix: the prefix of the folder name.
+    :return: the path of the new folder.
+    """
+    # SMD_TEST_TMPFS can point to a memory backed folder like /dev/shm
+    return tempfile.mkdtemp(prefix=prefix,
+                            dir=os.environ.get('SMD_TEST_TMPFS'))
+
+
+def remove_test_dir(path: str) -> None:
+    """Removes a folder created with :func:`make_test_dir`.
+
+    :param path: the path of the folder.
+    """
+    # SMD_KEEP_ARTIFACTS keeps the test files around for inspection
+    if not os.environ.get('SMD_KEEP_ARTIFACTS'):
+        shutil.rmtree(path)
+
+
+@functools.lru_cache(maxsize=None)
+def load_json(*path: str) -> 'Any':
+    """Gets the parsed content of a JSON fixture file, each file is parsed
+    only once, the returned objects must not be modified.
+
+    :param path: the path components of the fixture file.
+    :return: the parsed JSON data.
+    """
+    with open(os.path.join(*path), 'rb') as data_fh:
+        return json_loads(data_fh.read())
+
+
+def feed_stdin(test_case: unittest.TestCase, text: str) -> None:
+    """Replaces :data:`sys.stdin` with a stream holding the given text,
+    the original stream is restored at the end of the test.
+
+    :param test_case: the running test.
+    :param text: the text to read from stdin.
+    """
+    test_case.addCleanup(setattr, sys, 'stdin', sys.stdin)
+    sys.stdin = StringIO(text)
 
 
 class Downloader(smd.downloader.Downloader):
@@ -45,12 +102,13 @@ class Downloader(smd.downloader.Downloader):
 
     def __init__(self, name: str = 'test-site', lang: str = 'en',
                  site_url: str = 'http://test-site.com') -> None:
-        super().__init__(name, lang, site_url)
+        # the parent initializer is skipped on purpose, this downloader
+        # never connects to the network so it doesn't need an URL opener
+        self.name = name
+        self.lang = lang
+        self.site_url = site_url
         self.logger = logging.getLogger()
 
-    def _init_logger(self) -> None:
-        pass
-
     def get_chapters(self, manga_url: str) -> list:
         return []
 
@@ -71,6 +129,8 @@ class TestFunctions(unittest.TestCase):
     # stdout = None    # type: TextIO
     test_dir = None  # type: str
     data_dir = None  # type: str
+    mangas_dir = None  # type: str
+    downloaders = None  # type: List[smd.downloader.Downloader]
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -78,8 +138,11 @@ class TestFunctions(unittest.TestCase):
         # cls.stdout = sys.stdout
         cls.test_dir = os.path.join(TEST_DIR, 'functions')
         cls.data_dir = DATA_DIR
+        # the mangas are only read by the tests, so no need to copy them
+        cls.mangas_dir = os.path.join(cls.data_dir, 'mangas_folder')
+        # tests that reorder the list must use a copy
+        cls.downloaders = [Downloader('d{}'.format(i)) for i in range(1, 4)]
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
 
     @classmethod
     def tearDownClass(cls) -> None:
@@ -90,7 +153,6 @@ class TestFunctions(unittest.TestCase):
     def tearDown(self) -> None:
         smd.CONF_DIR = self.CONF_DIR
         smd.set_locale = TestFunctions.set_locale  # type: ignore
-        sys.stdin.close()
         # sys.stdout = self.stdout
 
     def test_keyboard_interrupt(self) -> None:
@@ -124,14 +186,12 @@ class TestFunctions(unittest.TestCase):
 
     def test_download(self) -> None:
         """Tests :func:`smd.download` function."""
-        downloaders = [
-            Downloader('d{}'.format(i)) for i in range(1, 4)
-        ]  # type: List[smd.downloader.Downloader]
-        sys.stdin = StringIO("1\n1")
+        feed_stdin(self, "1\n1")
         manga = 'naruto'
         chap_selectors = ''
         tryall = True
-        success = smd.download(downloaders[:], manga, chap_selectors, tryall)
+        success = smd.download(self.downloaders[:], manga, chap_selectors,
+                               tryall)
         self.assertFalse(success)
         self.assertEqual(sys.stdin.read(), '')
 
@@ -142,7 +202,7 @@ class TestFunctions(unittest.TestCase):
             Downloader('d{}'.format(i), lang)
             for i, lang in enumerate(langs, 1)
         ]  # type: List[smd.downloader.Downloader]
-        sys.stdin = StringIO('1\n')
+        feed_stdin(self, '1\n')
         downls = smd.filter_downloaders('wrong lang', downloaders)
         exp_downls = [d for d in downloaders
                       if d.lang == sorted(set(langs))[0]]
@@ -168,10 +228,8 @@ class TestFunctions(unittest.TestCase):
         def resume(m: smd.utils.Manga):
             resumed_mangas.append(m.title)
         i, j = 1, 2
-        sys.stdin = StringIO('{} {}'.format(i, j))
-        data_md = os.path.join(self.data_dir, 'mangas_folder')
-        mangas_dir = os.path.join(self.test_dir, 'mangas_resume')
-        shutil.copytree(data_md, mangas_dir)
+        feed_stdin(self, '{} {}'.format(i, j))
+        mangas_dir = self.mangas_dir
         downloaders = [
             Downloader('test-site')]  # type: List[smd.downloader.Downloader]
         resumed_mangas = []  # type: List[str]
@@ -193,12 +251,10 @@ class TestFunctions(unittest.TestCase):
 
     def test_select_downloader(self) -> None:
         """Tests :func:`smd.select_downloader` function."""
-        downloaders = [
-            Downloader('d{}'.format(i)) for i in range(1, 4)
-        ]  # type: List[smd.downloader.Downloader]
+        downloaders = self.downloaders
         i = 2
         exp_downl = downloaders[i-1]
-        sys.stdin = StringIO("{}\n{}\n{}".format(len(downloaders)+1, -1, i))
+        feed_stdin(self, "{}\n{}\n{}".format(len(downloaders)+1, -1, i))
         downl = smd.select_downloader(downloaders)
         self.assertIs(downl, exp_downl)
         self.assertEqual(sys.stdin.read(), '')
@@ -208,22 +264,20 @@ class TestFunctions(unittest.TestCase):
         langs = 'es en de'.split()
         i = 1
         stdin = "{}\n{}\n{}".format(len(langs)+1, -1, i)
-        sys.stdin = StringIO(stdin)
+        feed_stdin(self, stdin)
         lang = smd.select_lang(langs)
         self.assertEqual(lang, langs[i-1])
         self.assertEqual(sys.stdin.read(), '')
 
     def test_set_site(self) -> None:
         """Tests :func:`smd.set_site` function."""
-        downloaders = [
-            Downloader('d{}'.format(i)) for i in range(1, 4)
-        ]  # type: List[smd.downloader.Downloader]
+        downloaders = self.downloaders[:]
         i = 2
         site = 'd{}'.format(i)
         exp_downl = downloaders[i-1]
         smd.set_site(site, downloaders)
         self.assertIs(downloaders[0], exp_downl)
-        sys.stdin = StringIO("{}\n{}\n{}".format(len(downloaders)+1, -1, i))
+        feed_stdin(self, "{}\n{}\n{}".format(len(downloaders)+1, -1, i))
         exp_downl = downloaders[i-1]
         smd.set_site('unknow site', downloaders)
         self.assertIs(downloaders[0], exp_downl)
@@ -243,10 +297,8 @@ class TestFunctions(unittest.TestCase):
             nonlocal updated_mangas
             updated_mangas.append(manga.title)
         i, j = 1, 2
-        sys.stdin = StringIO('{} {}'.format(i, j))
-        data_md = os.path.join(self.data_dir, 'mangas_folder')
-        mangas_dir = os.path.join(self.test_dir, 'mangas_update')
-        shutil.copytree(data_md, mangas_dir)
+        feed_stdin(self, '{} {}'.format(i, j))
+        mangas_dir = self.mangas_dir
         downloaders = [
             Downloader('test-site')]  # type: List[smd.downloader.Downloader]
         updated_mangas = []  # type: List[str]
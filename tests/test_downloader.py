@@ -5,46 +5,153 @@
 Offline tests for the :mod:`smd.downloader` module.
 
 """
-from io import BytesIO, StringIO
+from io import BytesIO
+from pathlib import Path
+import functools
 import json
 import logging
 import os
 import shutil
-import sys
 import typing
 import unittest
+from unittest import mock
 import urllib
 
 import smd
+from tests import load_json, make_test_dir, remove_test_dir
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, List
+    from typing import Callable, Dict, List
 
 ROOT = os.path.dirname(os.path.abspath(__file__))  # type: str
 DATA_DIR = os.path.join(ROOT, 'data', 'downloader')  # type: str
-TEST_DIR = os.path.join(os.path.dirname(ROOT), 'test_downloader_temp')  # type:str
+TEST_DIR = None  # type: str
+FIXTURES = {}  # type: Dict[str, bytes]
+DOWNLOADERS = []  # type: List[smd.downloader.Downloader]
+LOGFILE = smd.downloader.Downloader.logfile
+INIT_LOGGER = smd.downloader.Downloader._init_logger
+MISSING = object()  # sentinel for values not computed yet
 
 
 def setUpModule() -> None:
-    os.mkdir(TEST_DIR)
+    global TEST_DIR
+    TEST_DIR = make_test_dir('smd_test_downloader_')
+    smd.downloader.Downloader.logfile = os.path.join(TEST_DIR, 'smd.log')
+    smd.downloader.Downloader._init_logger = init_null_logger  # type: ignore
+    for dirpath, __, filenames in os.walk(DATA_DIR):
+        for name in filenames:
+            path = os.path.normpath(os.path.join(dirpath, name))
+            FIXTURES[path] = Path(path).read_bytes()
 
 
 def tearDownModule() -> None:
-    shutil.rmtree(TEST_DIR)
+    for downl in DOWNLOADERS:
+        for handler in downl.logger.handlers:
+            handler.close()
+    DOWNLOADERS.clear()
+    smd.downloader.Downloader.logfile = LOGFILE
+    smd.downloader.Downloader._init_logger = INIT_LOGGER  # type: ignore
+    remove_test_dir(TEST_DIR)
+
+
+def init_null_logger(self: 'smd.downloader.Downloader') -> None:
+    """Used to override :meth:`smd.downloader.Downloader._init_logger`
+    method to avoid opening the log file for every downloader.
+    """
+    self.logger = logging.Logger(self.name)
+    self.logger.parent = None  # type: ignore
+    self.logger.addHandler(logging.NullHandler())
+
+
+def init_site_test(test_case: 'type', name: str,
+                   downloader: 'smd.downloader.Downloader') -> None:
+    """Sets the ``test_dir``, ``data_dir`` and ``downl`` attributes of a
+    site test case, the downloader logger handlers are closed by
+    :func:`tearDownModule`.
+
+    :param test_case: the test case class.
+    :param name: the name of the test and data folders of the site.
+    :param downloader: the downloader to test.
+    """
+    test_case.test_dir = os.path.join(TEST_DIR, name)
+    test_case.data_dir = os.path.join(DATA_DIR, name)
+    os.makedirs(test_case.test_dir, exist_ok=True)
+    test_case.downl = downloader
+    DOWNLOADERS.append(downloader)
 
 
 def cached(fn: 'Callable') -> 'Callable':
     """Class to cache return values of dummy functions."""
-    memo = {}  # type: dict
+    memo = [MISSING]
     def wrapper(*args, **kargs):
-        try:
-            return memo['result']
-        except KeyError:
-            memo['result'] = fn(*args, **kargs)
-            return memo['result']
+        if memo[0] is MISSING:
+            memo[0] = fn(*args, **kargs)
+        return memo[0]
     return wrapper
 
 
+def link_tree(src: str, dst: str) -> None:
+    """Copies the folder ``src`` to ``dst`` using hard links for the files
+    when possible, the linked files must not be modified.
+
+    :param src: the folder to copy.
+    :param dst: the destination path.
+    """
+    def link(src_file: str, dst_file: str) -> None:
+        try:
+            os.link(src_file, dst_file)
+        except OSError:
+            shutil.copy2(src_file, dst_file)
+    shutil.copytree(src, dst, copy_function=link)
+
+
+def read_fixture(*path: str) -> bytes:
+    """Gets the content of a fixture file, all the files in ``DATA_DIR``
+    are loaded in memory by :func:`setUpModule`.
+
+    :param path: the path components of the fixture file.
+    :return: the file content.
+    """
+    return FIXTURES[os.path.normpath(os.path.join(*path))]
+
+
+@functools.lru_cache(maxsize=None)
+def read_text_fixture(*path: str) -> str:
+    """Gets the content of a fixture file decoded as it would be by
+    :meth:`smd.downloader.Downloader.get_str`, each file is decoded only
+    once.
+
+    :param path: the path components of the fixture file.
+    :return: the file text.
+    """
+    return read_fixture(*path).decode(errors='ignore')
+
+
+def fake_get_str(data_dir: str, search_url: str, search_key: str = None,
+                 search_ext: str = '.html') -> 'Callable':
+    """Creates a function to override
+    :meth:`smd.downloader.Downloader.get_str` method to emulate online
+    connection, pages are taken from ``data_dir`` fixtures.
+
+    :param data_dir: the folder where the site pages are stored.
+    :param search_url: the URL used by the downloader to search mangas.
+    :param search_key: the request parameter with the search query, if
+                       ``None`` the query is taken from the URL path.
+    :param search_ext: the file extension of the search results pages.
+    :return: the function to use as ``get_str`` method.
+    """
+    def get_str(url: str, data: dict = None, method: str = 'GET',
+                xhr: bool = False) -> str:
+        if search_key is None and url.startswith(search_url):
+            data_name = 'search/'+url[len(search_url):]
+        elif url == search_url:
+            data_name = 'search/'+data[search_key]+search_ext  # type: ignore
+        else:
+            data_name = url
+        return read_text_fixture(data_dir, data_name)
+    return get_str
+
+
 class Downloader(smd.downloader.Downloader):
 
     """A Downloader class for testing abstract parent class
@@ -60,56 +167,43 @@ class Downloader(smd.downloader.Downloader):
         """Used to override :meth:`smd.downloader.Downloader.get_bytes`
         method to emulate online connection.
         """
-        path = os.path.join(DATA_DIR, url)
-        with open(path, 'rb') as file_handler:
-            return file_handler.read()
+        return read_fixture(DATA_DIR, url)
 
     @cached
     def search(self, manga: str) -> 'List[smd.utils.Manga]':
-        with open(os.path.join(DATA_DIR, 'search.json')) as data_fh:
-            return  [smd.utils.Manga('', title, url, self.name)
-                     for title, url in json.load(data_fh)]
+        return [smd.utils.Manga('', title, url, self.name)
+                for title, url in load_json(DATA_DIR, 'search.json')]
 
     @cached
     def get_chapters(self, manga_url: str) -> 'List[smd.utils.Chapter]':
-        with open(os.path.join(DATA_DIR, 'get_chapters.json')) as data_fh:
-            return [smd.utils.Chapter('', title, url)
-                    for title, url in json.load(data_fh)]
+        return [smd.utils.Chapter('', title, url)
+                for title, url in load_json(DATA_DIR, 'get_chapters.json')]
 
     @cached
     def get_images(self, chapter_url: str) -> 'List[str]':
-        with open(os.path.join(DATA_DIR, 'get_images.json')) as data_fh:
-            return json.load(data_fh)
+        return load_json(DATA_DIR, 'get_images.json')
 
     def get_image(self, image_url: str) -> str:
-        try:
-            return self._image[image_url]
-        except AttributeError:
-            with open(os.path.join(DATA_DIR, 'get_image.json')) as data_fh:
-                self._image = json.load(data_fh)  # type: dict
-            return self._image[image_url]
+        return load_json(DATA_DIR, 'get_image.json')[image_url]
 
 
 class TestDownloader(unittest.TestCase):
 
     """Tests :class:`smd.downloader.Downloader` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
+    test_dir = None   # type: str
+    data_dir = None   # type: str
+    manga_dir = None  # type: str
+    downl = None      # type: Downloader
 
     @classmethod
     def setUpClass(cls) -> None:
         cls.test_dir = os.path.join(TEST_DIR, 'downloader')
         cls.data_dir = DATA_DIR
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-
-    def setUp(self) -> None:
-        self.downl = Downloader()
-
-    def tearDown(self) -> None:
-        sys.stdin.close()
-        del self.downl
+        cls.manga_dir = os.path.join(cls.data_dir, 'TestManga')
+        os.makedirs(cls.test_dir, exist_ok=True)
+        cls.downl = Downloader()
+        DOWNLOADERS.append(cls.downl)
 
     def test_init(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.__init__` method."""
@@ -138,8 +232,8 @@ class TestDownloader(unittest.TestCase):
         """Tests :meth:`smd.downloader.Downloader._download_chapter`
         function."""
         chap_dir = os.path.join(self.test_dir, 'test_download_chapter')
-        shutil.copytree(os.path.join(self.data_dir, 'TestManga', 'chap1'),
-                        chap_dir)
+        # the chapter data is given below, only an empty folder is needed
+        os.mkdir(chap_dir)
         chap = smd.utils.Chapter(chap_dir, 'title', 'url')
         self.downl._download_chapter(chap)
         self.assertEqual(chap.current, 3)
@@ -152,34 +246,39 @@ class TestDownloader(unittest.TestCase):
 
     def test_init_logger(self) -> None:
         """Tests :meth:`smd.downloader.Downloader._init_logger` method."""
-        self.downl.logger.handlers[0].close()
-        del self.downl.logger
-        self.downl._init_logger()
-        self.assertIsInstance(self.downl.logger, logging.Logger)
+        # the shared downloader must keep its null logger
+        downl = Downloader()
+        INIT_LOGGER(downl)
+        for handler in downl.logger.handlers:
+            self.addCleanup(handler.close)
+        self.assertIsInstance(downl.logger, logging.Logger)
+        self.assertEqual(len(downl.logger.handlers), 2)
 
     def test_download(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.download` method."""
         manga_dir = 'PROBLEMATIC NARUTO'
-        sys.stdin = StringIO('3\n'+manga_dir)
-        self.assertTrue(self.downl.download('naruto', '1:3'))
-        self.assertEqual(sys.stdin.read(), '')
+        # the manga folder is created in the working directory
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.test_dir)
+        with mock.patch('builtins.input',
+                        side_effect=['3', manga_dir]) as fake_input:
+            self.assertTrue(self.downl.download('naruto', '1:3'))
+        self.assertEqual(fake_input.call_count, 2)
         manga_dir = os.path.join(self.test_dir, manga_dir)
-        self.assertTrue(manga_dir)
         self.assertTrue(os.path.isfile(
             os.path.join(manga_dir, smd.utils.Manga.data_filename)))
-        for i in range(1, 4):
-            path = os.path.join(manga_dir, str(i).zfill(6),
-                                smd.utils.Chapter.data_filename)
-            with self.subTest(i=i):
-                self.assertTrue(os.path.isfile(path))
+        paths = [os.path.join(manga_dir, str(i).zfill(6),
+                              smd.utils.Chapter.data_filename)
+                 for i in range(1, 4)]
+        self.assertEqual([p for p in paths if not os.path.isfile(p)], [])
 
     def test_download_img(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.download_img` method."""
-        self.downl.download_img('images/img1.jpeg', 'test_01')
-        with open('test_01.jpeg', 'rb') as img_fh:
-            img = img_fh.read()
+        name = os.path.join(self.test_dir, 'test_01')
+        file_name = self.downl.download_img('images/img1.jpeg', name)
+        self.assertEqual(file_name, name+'.jpeg')
         exp_img = self.downl.get_bytes('images/img1.jpeg')
-        self.assertEqual(img, exp_img)
+        self.assertEqual(Path(file_name).read_bytes(), exp_img)
 
     def test_get_bytes(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.get_bytes` method."""
@@ -191,21 +290,19 @@ class TestDownloader(unittest.TestCase):
         def url_open2(req):
             raise ConnectionResetError
 
-        self.downl.url_opener.open = url_open1  # type: ignore
+        get_bytes = smd.downloader.Downloader.get_bytes
+        opener = self.downl.url_opener
         url = 'http://test.com'
-        resp = smd.downloader.Downloader.get_bytes(self.downl, url)
-        self.assertEqual(resp, exp_resp)
         data = {'user': 'name', 'password': 'passwd'}
-        resp = smd.downloader.Downloader.get_bytes(self.downl, url, data)
-        self.assertEqual(resp, exp_resp)
-        resp = smd.downloader.Downloader.get_bytes(self.downl, url, data,
-                                                   'POST', True)
-        self.assertEqual(resp, exp_resp)
-        with self.assertRaises(ValueError):
-            smd.downloader.Downloader.get_bytes(self.downl, url, method='UNKNOW')
-        self.downl.url_opener.open = url_open2  # type: ignore
-        with self.assertRaises(ConnectionResetError):
-            smd.downloader.Downloader.get_bytes(self.downl, url)
+        cases = ((), (data,), (data, 'POST', True))
+        with mock.patch.object(opener, 'open', url_open1):
+            resps = [get_bytes(self.downl, url, *args) for args in cases]
+            self.assertEqual(resps, [exp_resp]*len(cases))
+            with self.assertRaises(ValueError):
+                get_bytes(self.downl, url, method='UNKNOW')
+        with mock.patch.object(opener, 'open', url_open2):
+            with self.assertRaises(ConnectionResetError):
+                get_bytes(self.downl, url)
 
     def test_get_image(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.get_image` method."""
@@ -221,22 +318,27 @@ class TestDownloader(unittest.TestCase):
 
     def test_get_str(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.get_str` method."""
-        self.downl.get_bytes = lambda url: b'Testing get_str()'  # type: ignore
-        self.assertEqual(self.downl.get_str('url'), 'Testing get_str()')
+        with mock.patch.object(self.downl, 'get_bytes',
+                               return_value=b'Testing get_str()'):
+            self.assertEqual(self.downl.get_str('url'), 'Testing get_str()')
+
+    def test_null_logger(self) -> None:
+        """Checks the shared downloader doesn't log to the console or to
+        the log file, it runs after :meth:`test_init_logger`."""
+        self.assertEqual([type(h) for h in self.downl.logger.handlers],
+                         [logging.NullHandler])
 
     def test_resume(self) -> None:
         """Tests :meth:`smd.downloader.Downloader.resume` method."""
         def download_chapter(chap: smd.utils.Chapter):
             resumed_chaps.append([chap.title, chap.url])
         resumed_chaps = []  # type: List[List[str]]
-        manga_dir = os.path.join(self.test_dir, 'test_resume')
-        shutil.copytree(os.path.join(self.data_dir, 'TestManga'), manga_dir)
-        manga = smd.utils.Manga.from_folder(manga_dir)
-        self.downl._download_chapter = download_chapter  # type: ignore
-        self.downl.resume(manga)
-        data_file = os.path.join(self.data_dir, 'resumed_chaps.json')
-        with open(data_file) as data_fh:
-            exp_resumed_chaps = json.load(data_fh)
+        # the manga folder isn't modified, so no need to copy it
+        manga = smd.utils.Manga.from_folder(self.manga_dir)
+        with mock.patch.object(self.downl, '_download_chapter',
+                               download_chapter):
+            self.downl.resume(manga)
+        exp_resumed_chaps = load_json(self.data_dir, 'resumed_chaps.json')
         self.assertEqual(resumed_chaps, exp_resumed_chaps)
 
     def test_update(self) -> None:
@@ -245,524 +347,208 @@ class TestDownloader(unittest.TestCase):
             new_chaps.append([chap.title, chap.url])
         new_chaps = []  # type: List[List[str]]
         manga_dir = os.path.join(self.test_dir, 'test_update')
-        shutil.copytree(os.path.join(self.data_dir, 'TestManga'), manga_dir)
+        link_tree(self.manga_dir, manga_dir)
         manga = smd.utils.Manga.from_folder(manga_dir)
-        self.downl._download_chapter = download_chapter  # type: ignore
-        self.downl.update(manga)
-        with open(os.path.join(self.data_dir, 'new_chaps.json')) as data_fh:
-            exp_new_chaps = json.load(data_fh)
+        with mock.patch.object(self.downl, '_download_chapter',
+                               download_chapter):
+            self.downl.update(manga)
+        exp_new_chaps = load_json(self.data_dir, 'new_chaps.json')
         self.assertEqual(new_chaps, exp_new_chaps)
 
 
-class TestNineManga(unittest.TestCase):
+class SiteTest:
 
-    """Tests :class:`smd.downloader.NineManga` class."""
+    """Common tests for the site downloaders, test cases inherit from this
+    class and :class:`unittest.TestCase` and set the class attributes
+    describing the site.
+    """
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.NineManga
+    site = None          # type: str
+    downloader = None    # type: Callable
+    exp_name = None      # type: str
+    exp_lang = None      # type: str
+    exp_site_url = None  # type: str
+    search_route = None  # type: str
+    search_key = None    # type: str
+    search_ext = '.html'
+    chapters_url = 'mangas/naruto1.html'
+    images_url = 'image_pages/naruto1_ch1_img1.html'
+    test_dir = None      # type: str
+    data_dir = None      # type: str
+    downl = None         # type: smd.downloader.Downloader
+    exp_search = None    # type: list
+    exp_chapters = None  # type: list
+    exp_images = None    # type: list
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'ninemanga')
-        cls.data_dir = os.path.join(DATA_DIR, 'ninemanga')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.NineManga('en')
-        cls.downl.get_str = cls.get_str  # type: ignore
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
-
-    @classmethod
-    def get_str(cls, url: str, data: dict = None) -> str:
-        """Used to override :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        if url.endswith('/search/'):
-            data_name = 'search/'+data['wd']+'.html'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(cls.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
+        init_site_test(cls, cls.site, cls.downloader())
+        cls.exp_search = [(title, url) for title, url
+                          in load_json(cls.data_dir, 'search.json')]
+        cls.exp_chapters = [(title, url) for title, url
+                            in load_json(cls.data_dir, 'get_chapters.json')]
+        cls.exp_images = load_json(cls.data_dir, 'get_images.json')
+        cls.downl.get_str = fake_get_str(  # type: ignore
+            cls.data_dir, cls.downl.site_url+cls.search_route, cls.search_key,
+            cls.search_ext)
 
     def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.NineManga.__init__` method."""
-        self.assertEqual(self.downl.name, 'ninemanga-en')
-        self.assertEqual(self.downl.lang, 'en')
-        self.assertEqual(self.downl.site_url, 'http://en.ninemanga.com')
+        """Tests the ``__init__`` method of the downloader."""
+        self.assertEqual(self.downl.name, self.exp_name)
+        self.assertEqual(self.downl.lang, self.exp_lang)
+        self.assertEqual(self.downl.site_url, self.exp_site_url)
 
     def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.NineManga.search` method."""
+        """Tests the ``search`` method of the downloader."""
         results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
+        self.assertEqual(results, self.exp_search)
 
     def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.NineManga.get_chapters` method."""
-        chaps = self.downl.get_chapters('mangas/naruto1_warning.html')
-        chapters = [(c.title, c.url) for c in chaps]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
+        """Tests the ``get_chapters`` method of the downloader."""
+        chapters = [(c.title, c.url)
+                    for c in self.downl.get_chapters(self.chapters_url)]
+        self.assertEqual(chapters, self.exp_chapters)
 
     def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.NineManga.get_images` method."""
-        site_url = self.downl.site_url
-        images_pages = self.downl.get_images(
-            'image_pages/naruto1_ch1_img1.html')
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = [site_url+link for link in json.load(data_fh)]
-        self.assertEqual(images_pages, exp_pages)
+        """Tests the ``get_images`` method of the downloader."""
+        images_pages = self.downl.get_images(self.images_url)
+        self.assertEqual(images_pages, self.exp_images)
 
     def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.NineManga.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
+        """Tests the ``get_image`` method of the downloader."""
+        exp_image = load_json(self.data_dir, 'get_image.json')
+        images = {url: self.downl.get_image(url) for url in exp_image}
+        self.assertEqual(images, exp_image)
 
 
-class TestHeavenManga(unittest.TestCase):
+class TestNineManga(SiteTest, unittest.TestCase):
 
-    """Tests :class:`smd.downloader.HeavenManga` class."""
+    """Tests :class:`smd.downloader.NineManga` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.HeavenManga
+    site = 'ninemanga'
+    downloader = functools.partial(smd.downloader.NineManga, 'en')
+    exp_name = 'ninemanga-en'
+    exp_lang = 'en'
+    exp_site_url = 'http://en.ninemanga.com'
+    search_route = '/search/'
+    search_key = 'wd'
+    chapters_url = 'mangas/naruto1_warning.html'
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'heavenmanga')
-        cls.data_dir = os.path.join(DATA_DIR, 'heavenmanga')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.HeavenManga()
-        cls.downl.get_str = cls.get_str  # type: ignore
+        super().setUpClass()
+        site_url = cls.downl.site_url
+        cls.exp_images = [site_url+link for link in cls.exp_images]
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
 
-    @classmethod
-    def get_str(cls, url: str) -> str:
-        """Method used to override the :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        search_url = TestHeavenManga.downl.site_url+'/buscar/'
-        if url.startswith(search_url):
-            data_name = os.path.join('search', url.replace(search_url, ''))
-        else:
-            data_name = url
-        path = os.path.join(TestHeavenManga.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
-
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.HeavenManga.__init__` method."""
-        self.assertEqual(self.downl.name, 'heavenmanga')
-        self.assertEqual(self.downl.lang, 'es')
-        self.assertEqual(self.downl.site_url, 'http://heavenmanga.com')
+class TestHeavenManga(SiteTest, unittest.TestCase):
 
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.HeavenManga.search` method."""
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
-
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.HeavenManga.get_chapters` method."""
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
+    """Tests :class:`smd.downloader.HeavenManga` class."""
 
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.HeavenManga.get_images` method."""
-        images_pages = self.downl.get_images('chapter_pages/naruto1_ch1.html')
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = json.load(data_fh)  # type: List[str]
-        self.assertEqual(images_pages, exp_pages)
+    site = 'heavenmanga'
+    downloader = smd.downloader.HeavenManga
+    exp_name = 'heavenmanga'
+    exp_lang = 'es'
+    exp_site_url = 'http://heavenmanga.com'
+    search_route = '/buscar/'
+    images_url = 'chapter_pages/naruto1_ch1.html'
 
-    def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.HeavenManga.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
 
-
-class TestMangaReader(unittest.TestCase):
+class TestMangaReader(SiteTest, unittest.TestCase):
 
     """Tests :class:`smd.downloader.MangaReader` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.MangaReader
+    site = 'mangareader'
+    downloader = smd.downloader.MangaReader
+    exp_name = 'mangareader'
+    exp_lang = 'en'
+    exp_site_url = 'https://www.mangareader.net'
+    search_route = '/actions/search/'
+    search_key = 'q'
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'mangareader')
-        cls.data_dir = os.path.join(DATA_DIR, 'mangareader')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.MangaReader()
-        cls.downl.get_str = cls.get_str  # type: ignore
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
+        super().setUpClass()
+        site_url = cls.downl.site_url
+        cls.exp_search = [(title, site_url+'/'+url)
+                          for title, url in cls.exp_search]
+        cls.exp_chapters = [(title, site_url+'/'+url)
+                            for title, url in cls.exp_chapters]
+        cls.exp_images = [site_url+'/'+link for link in cls.exp_images]
 
-    @classmethod
-    def get_str(cls, url: str, data: dict = None) -> str:
-        """Used to override the :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        if url.endswith('/actions/search/'):
-            data_name = 'search/'+data['q']+'.html'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(TestMangaReader.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
 
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.MangaReader.__init__` method."""
-        self.assertEqual(self.downl.name, 'mangareader')
-        self.assertEqual(self.downl.lang, 'en')
-        self.assertEqual(self.downl.site_url, 'https://www.mangareader.net')
-
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.MangaReader.search` method."""
-        site_url = self.downl.site_url
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(l[0], site_url+'/'+l[1]) for l in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
-
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.MangaReader.get_chapters` method."""
-        site_url = self.downl.site_url
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(l[0], site_url+'/'+l[1]) for l in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
-
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.MangaReader.get_images` method."""
-        site_url = self.downl.site_url
-        images_pages = self.downl.get_images(
-            'image_pages/naruto1_ch1_img1.html')
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = [site_url+'/'+l for l in json.load(data_fh)]
-        self.assertEqual(images_pages, exp_pages)
-
-    def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.MangaReader.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
-
-
-class TestMangaAll(unittest.TestCase):
+class TestMangaAll(SiteTest, unittest.TestCase):
 
     """Tests :class:`smd.downloader.MangaAll` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.MangaAll
-
-    @classmethod
-    def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'mangaall')
-        cls.data_dir = os.path.join(DATA_DIR, 'mangaall')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.MangaAll()
-        cls.downl.get_str = cls.get_str  # type: ignore
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
-
-    @classmethod
-    def get_str(cls, url: str, data: dict = None) -> str:
-        """Used to override the :meth:`smd.downloader.Downloader.get`
-        method to emulate online connection.
-        """
-        if url.endswith('/search/'):
-            data_name = 'search/'+data['q']+'.html'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(TestMangaAll.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
-
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.MangaAll.__init__` method."""
-        self.assertEqual(self.downl.name, 'mangaall')
-        self.assertEqual(self.downl.lang, 'en')
-        self.assertEqual(self.downl.site_url, 'http://mangaall.net')
-
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.MangaAll.search` method."""
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
+    site = 'mangaall'
+    downloader = smd.downloader.MangaAll
+    exp_name = 'mangaall'
+    exp_lang = 'en'
+    exp_site_url = 'http://mangaall.net'
+    search_route = '/search/'
+    search_key = 'q'
 
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.MangaAll.get_chapters` method."""
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
 
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.MangaAll.get_images` method."""
-        images_pages = self.downl.get_images(
-            'image_pages/naruto1_ch1_img1.html')
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = json.load(data_fh)
-        self.assertEqual(images_pages, exp_pages)
-
-    def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.MangaAll.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
-
-
-class TestMangaDoor(unittest.TestCase):
+class TestMangaDoor(SiteTest, unittest.TestCase):
 
     """Tests :class:`smd.downloader.MangaDoor` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.MangaDoor
+    site = 'mangadoor'
+    downloader = smd.downloader.MangaDoor
+    exp_name = 'mangadoor'
+    exp_lang = 'es'
+    exp_site_url = 'http://mangadoor.com'
+    search_route = '/search/'
+    search_key = 'query'
+    search_ext = '.json'
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'mangadoor')
-        cls.data_dir = os.path.join(DATA_DIR, 'mangadoor')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.MangaDoor()
-        cls.downl.get_str = cls.get_str  # type: ignore
+        super().setUpClass()
+        site_url = cls.downl.site_url
+        cls.exp_search = [(title, site_url+'/'+url)
+                          for title, url in cls.exp_search]
+        cls.exp_images = [cls.images_url+'/'+link for link in cls.exp_images]
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
 
-    @classmethod
-    def get_str(cls, url: str, data: dict = None, method: str = 'GET',
-                xhr: bool = False) -> str:
-        """Used to override the :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        if url.endswith('/search/'):
-            data_name = 'search/'+data['query']+'.json'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(TestMangaDoor.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
-
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.MangaDoor.__init__` method."""
-        self.assertEqual(self.downl.name, 'mangadoor')
-        self.assertEqual(self.downl.lang, 'es')
-        self.assertEqual(self.downl.site_url, 'http://mangadoor.com')
-
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.MangaDoor.search` method."""
-        site_url = self.downl.site_url
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(l[0], site_url+'/'+l[1]) for l in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
-
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.MangaDoor.get_chapters` method."""
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
-
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.MangaDoor.get_images` method."""
-        chap_url = 'image_pages/naruto1_ch1_img1.html'
-        images_pages = self.downl.get_images(chap_url)
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = [chap_url+'/'+l for l in json.load(data_fh)]
-        self.assertEqual(images_pages, exp_pages)
-
-    def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.MangaDoor.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
-
-
-class TestMangaNelo(unittest.TestCase):
+class TestMangaNelo(SiteTest, unittest.TestCase):
 
     """Tests :class:`smd.downloader.MangaNelo` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.MangaNelo
+    site = 'manganelo'
+    downloader = smd.downloader.MangaNelo
+    exp_name = 'manganelo'
+    exp_lang = 'en'
+    exp_site_url = 'https://manganelo.com'
+    search_route = '/home_json_search/'
+    search_key = 'searchword'
+    search_ext = '.json'
+    images_url = 'image_pages/naruto1_ch1.html'
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'manganelo')
-        cls.data_dir = os.path.join(DATA_DIR, 'manganelo')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.MangaNelo()
-        cls.downl.get_str = cls.get_str  # type: ignore
+        super().setUpClass()
+        site_url = cls.downl.site_url
+        cls.exp_search = [(title, site_url+'/'+url)
+                          for title, url in cls.exp_search]
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
-
-    @classmethod
-    def get_str(cls, url: str, data: dict = None, method: str = 'GET',
-                xhr: bool = False) -> str:
-        """Used to override the :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        if url.endswith('/home_json_search/'):
-            data_name = 'search/'+data['searchword']+'.json'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(TestMangaNelo.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
-
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.MangaNelo.__init__` method."""
-        self.assertEqual(self.downl.name, 'manganelo')
-        self.assertEqual(self.downl.lang, 'en')
-        self.assertEqual(self.downl.site_url, 'https://manganelo.com')
-
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.MangaNelo.search` method."""
-        site_url = self.downl.site_url
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(l[0], site_url+'/'+l[1]) for l in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
-
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.MangaNelo.get_chapters` method."""
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
-
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.MangaNelo.get_images` method."""
-        chap_url = 'image_pages/naruto1_ch1.html'
-        images_pages = self.downl.get_images(chap_url)
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = json.load(data_fh)
-        self.assertEqual(images_pages, exp_pages)
+    def test_get_image(self) -> None:
+        self.skipTest('no get_image fixtures for this site')
 
 
-class TestMangaHere(unittest.TestCase):
+class TestMangaHere(SiteTest, unittest.TestCase):
 
     """Tests :class:`smd.downloader.MangaHere` class."""
 
-    test_dir = None  # type: str
-    data_dir = None  # type: str
-    downl = None     # type: smd.downloader.MangaHere
-
-    @classmethod
-    def setUpClass(cls) -> None:
-        cls.test_dir = os.path.join(TEST_DIR, 'mangahere')
-        cls.data_dir = os.path.join(DATA_DIR, 'mangahere')
-        os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
-        cls.downl = smd.downloader.MangaHere()
-        cls.downl.get_str = cls.get_str  # type: ignore
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        del cls.downl
-
-    @classmethod
-    def get_str(cls, url: str, data: dict = None, method: str = 'GET',
-                xhr: bool = False) -> str:
-        """Used to override the :meth:`smd.downloader.Downloader.get_str`
-        method to emulate online connection.
-        """
-        if url.endswith('/ajax/search.php'):
-            data_name = 'search/'+data['query']+'.json'  # type: ignore
-        else:
-            data_name = url
-        path = os.path.join(TestMangaHere.data_dir, data_name)
-        with open(path) as file_handler:
-            return file_handler.read()
-
-    def test_init(self) -> None:
-        """Tests :meth:`smd.downloader.MangaHere.__init__` method."""
-        self.assertEqual(self.downl.name, 'mangahere')
-        self.assertEqual(self.downl.lang, 'en')
-        self.assertEqual(self.downl.site_url, 'http://www.mangahere.cc')
-
-    def test_search(self) -> None:
-        """Tests :meth:`smd.downloader.MangaHere.search` method."""
-        results = [(d.title, d.url) for d in self.downl.search('naruto')]
-        with open(os.path.join(self.data_dir, 'search.json')) as data_fh:
-            exp_res = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(results, exp_res)
-
-    def test_get_chapters(self) -> None:
-        """Tests :meth:`smd.downloader.MangaHere.get_chapters` method."""
-        chapters = [(c.title, c.url)
-                    for c in self.downl.get_chapters('mangas/naruto1.html')]
-        with open(os.path.join(self.data_dir, 'get_chapters.json')) as data_fh:
-            exp_chaps = [(title, url) for title, url in json.load(data_fh)]
-        self.assertEqual(chapters, exp_chaps)
-
-    def test_get_images(self) -> None:
-        """Tests :meth:`smd.downloader.MangaHere.get_images` method."""
-        chap_url = 'image_pages/naruto1_ch1_img1.html'
-        images_pages = self.downl.get_images(chap_url)
-        with open(os.path.join(self.data_dir, 'get_images.json')) as data_fh:
-            exp_pages = json.load(data_fh)
-        self.assertEqual(images_pages, exp_pages)
-
-    def test_get_image(self) -> None:
-        """Tests :meth:`smd.downloader.MangaHere.get_image` method."""
-        with open(os.path.join(self.data_dir, 'get_image.json')) as data_fh:
-            exp_imgs = json.load(data_fh)
-        for url, exp_img in exp_imgs.items():
-            with self.subTest(exp_img=exp_img):
-                image = self.downl.get_image(url)
-                self.assertEqual(image, exp_img)
+    site = 'mangahere'
+    downloader = smd.downloader.MangaHere
+    exp_name = 'mangahere'
+    exp_lang = 'en'
+    exp_site_url = 'http://www.mangahere.cc'
+    search_route = '/ajax/search.php'
+    search_key = 'query'
+    search_ext = '.json'
 
 
 class TestFuntions(unittest.TestCase):
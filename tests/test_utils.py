@@ -8,7 +8,6 @@ Offline tests for the :mod:`smd.util` module.
 
 import configparser
 from io import StringIO
-import json
 import logging
 import os
 import shutil
@@ -20,6 +19,8 @@ import unittest
 from bs4 import BeautifulSoup  # type: ignore
 
 import smd.utils
+from tests import (feed_stdin, json_loads, load_json, make_test_dir,
+                   remove_test_dir)
 
 if typing.TYPE_CHECKING:
     from typing import TextIO
@@ -27,15 +28,16 @@ if typing.TYPE_CHECKING:
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(ROOT, 'data', 'util')
-TEST_DIR = os.path.join(os.path.dirname(ROOT), 'test_utils_temp')
+TEST_DIR = None  # type: str
 
 
 def setUpModule() -> None:
-    os.mkdir(TEST_DIR)
+    global TEST_DIR
+    TEST_DIR = make_test_dir('smd_test_utils_')
 
 
 def tearDownModule() -> None:
-    shutil.rmtree(TEST_DIR)
+    remove_test_dir(TEST_DIR)
 
 
 class MetaFolder(smd.utils.MetaFolder):
@@ -56,7 +58,6 @@ class TestMetaFolder(unittest.TestCase):
         cls.test_dir = os.path.join(TEST_DIR, 'metafolder')
         data_dir = os.path.join(DATA_DIR, 'metafolder')
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
         cls.mf_dir = os.path.join(data_dir, 'TestMetaFolder')
 
     def test_init(self) -> None:
@@ -70,9 +71,8 @@ class TestMetaFolder(unittest.TestCase):
 
     def test_load_from_folder(self) -> None:
         """Tests :meth:`smd.utils.MetaFolder._load_from_folder` method."""
-        mf_dir = os.path.join(self.test_dir, 'test_load_from_folder')
-        shutil.copytree(self.mf_dir, mf_dir)
-        mf = MetaFolder(mf_dir)
+        # the fixture is only read, so no need to copy it
+        mf = MetaFolder(self.mf_dir)
         MetaFolder._load_from_folder(mf)
         self.assertEqual(mf.attr1, 1)  # type: ignore
         self.assertEqual(mf.attr2, 2)  # type: ignore
@@ -86,9 +86,7 @@ class TestMetaFolder(unittest.TestCase):
 
     def test_is_valid(self) -> None:
         """Tests :meth:`smd.utils.MetaFolder.is_valid` method."""
-        mf_dir = os.path.join(self.test_dir, 'test_is_valid')
-        shutil.copytree(self.mf_dir, mf_dir)
-        self.assertTrue(MetaFolder.is_valid(mf_dir))
+        self.assertTrue(MetaFolder.is_valid(self.mf_dir))
         self.assertFalse(MetaFolder.is_valid(self.test_dir))
 
     def test_save_data(self) -> None:
@@ -98,8 +96,9 @@ class TestMetaFolder(unittest.TestCase):
         mf = MetaFolder(mf_dir)
         mf.attr1, mf.attr2, mf.attrNEW = 'a', 'b', 'c'  # type: ignore
         mf.save_data()
-        with open(os.path.join(mf_dir, MetaFolder.data_filename)) as data_fh:
-            data = json.load(data_fh)
+        data_file = os.path.join(mf_dir, MetaFolder.data_filename)
+        with open(data_file, 'rb') as data_fh:
+            data = json_loads(data_fh.read())
         self.assertEqual(len(data), 3)
         self.assertEqual(mf.attr1, data['attr1'])  # type: ignore
         self.assertEqual(mf.attr2, data['attr2'])  # type: ignore
@@ -122,7 +121,6 @@ class TestChapter(unittest.TestCase):
         data_dir = os.path.join(DATA_DIR, 'chapter')
         cls.chap_dir = os.path.join(data_dir, 'chap1')
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
 
     def test_init(self) -> None:
         """Tests :meth:`smd.utils.Chapter.__init__` method."""
@@ -154,9 +152,8 @@ class TestChapter(unittest.TestCase):
 
     def test_from_folder(self) -> None:
         """Tests :meth:`smd.utils.Chapter.from_folder` method."""
-        chap_dir = os.path.join(self.test_dir, 'test_from_folder')
-        shutil.copytree(self.chap_dir, chap_dir)
-        chap = smd.utils.Chapter.from_folder(chap_dir)
+        # the fixture is only read, so no need to copy it
+        chap = smd.utils.Chapter.from_folder(self.chap_dir)
         self.assertEqual(chap.title, 'chapter 1')
         self.assertEqual(chap.url, 'image_pages/naruto1_ch1_img1.html')
         self.assertEqual(chap.current, 3)
@@ -173,13 +170,12 @@ class TestConfig(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         cls.test_dir = os.path.join(TEST_DIR, 'config')
-        cls.cfg_path = os.path.join(cls.test_dir, 'smd.cfg')
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
 
-    def tearDown(self) -> None:
-        if os.path.exists(self.cfg_path):
-            os.remove(self.cfg_path)
+    def setUp(self) -> None:
+        # each test gets its own file, all are removed with TEST_DIR
+        self.cfg_path = os.path.join(self.test_dir,
+                                     self._testMethodName+'.cfg')
 
     def test_init_getitem_and_setitem(self) -> None:
         """Tests :meth:`smd.utils.Config.__init__` and
@@ -230,15 +226,17 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(os.path.exists(self.cfg_path))
 
 
+class DummyRecord(logging.LogRecord):
+    def __init__(self):
+        self.exc_info = 'info'
+        self.exc_text = 'text'
+
+
 class TestConsoleFilter(unittest.TestCase):
 
     """Tests :class:`smd.utils.ConsoleFilter` class."""
 
     def test_filter(self) -> None:
-        class DummyRecord(logging.LogRecord):
-            def __init__(self):
-                self.exc_info = 'info'
-                self.exc_text = 'text'
         self.assertIsInstance(smd.utils.ConsoleFilter(), logging.Filter)
         record = DummyRecord()
         self.assertTrue(smd.utils.ConsoleFilter.filter(record))
@@ -259,7 +257,6 @@ class TestManga(unittest.TestCase):
         data_dir = os.path.join(DATA_DIR, 'manga')
         cls.manga_dir = os.path.join(data_dir, 'TestManga')
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
 
     def test_init(self) -> None:
         """Tests :meth:`smd.utils.Manga.__init__` method."""
@@ -291,9 +288,8 @@ class TestManga(unittest.TestCase):
 
     def test_chapters(self) -> None:
         """Tests :meth:`smd.utils.Manga.chapters` method."""
-        manga_dir = os.path.join(self.test_dir, 'test_chapters')
-        shutil.copytree(self.manga_dir, manga_dir)
-        manga = smd.utils.Manga.from_folder(manga_dir)
+        # the fixture is only read, so no need to copy it
+        manga = smd.utils.Manga.from_folder(self.manga_dir)
         chaps_gen = manga.chapters()
         self.assertIsInstance(chaps_gen, types.GeneratorType)
         chaps = list(chaps_gen)
@@ -305,9 +301,8 @@ class TestManga(unittest.TestCase):
 
     def test_from_folder(self) -> None:
         """Tests :meth:`smd.utils.Manga.from_folder` method."""
-        manga_dir = os.path.join(self.test_dir, 'test_from_folder')
-        shutil.copytree(self.manga_dir, manga_dir)
-        manga = smd.utils.Manga.from_folder(manga_dir)
+        # the fixture is only read, so no need to copy it
+        manga = smd.utils.Manga.from_folder(self.manga_dir)
         self.assertEqual(manga.title, 'TestManga')
         self.assertEqual(manga.url, 'mangas/testmanga.html')
         self.assertEqual(manga.site, 'manga-test')
@@ -339,6 +334,7 @@ class TestFunctions(unittest.TestCase):
     stdout = None    # type: TextIO
     test_dir = None  # type: str
     data_dir = None  # type: str
+    mangas_dir = None  # type: str
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -346,8 +342,8 @@ class TestFunctions(unittest.TestCase):
         cls.stdout = sys.stdout
         cls.test_dir = os.path.join(TEST_DIR, 'functions')
         cls.data_dir = DATA_DIR
+        cls.mangas_dir = os.path.join(cls.data_dir, 'mangas_folder')
         os.mkdir(cls.test_dir)
-        os.chdir(cls.test_dir)
 
     @classmethod
     def tearDownClass(cls) -> None:
@@ -355,7 +351,6 @@ class TestFunctions(unittest.TestCase):
         sys.stdout = cls.stdout
 
     def tearDown(self) -> None:
-        sys.stdin.close()
         sys.stdout = self.stdout
 
     def test_die(self) -> None:
@@ -369,10 +364,8 @@ class TestFunctions(unittest.TestCase):
 
     def test_get_mangas(self) -> None:
         """Tests :func:`smd.util.get_mangas` function."""
-        mangas_dir = os.path.join(self.test_dir, 'test_get_mangas')
-        shutil.copytree(os.path.join(self.data_dir, 'mangas_folder'),
-                        mangas_dir)
-        mangas = smd.utils.get_mangas(mangas_dir)
+        # the fixture is only read, so no need to copy it
+        mangas = smd.utils.get_mangas(self.mangas_dir)
         self.assertEqual(len(mangas), 3)
         for i, manga in enumerate(mangas, 1):
             with self.subTest(i=i):
@@ -381,23 +374,24 @@ class TestFunctions(unittest.TestCase):
 
     def test_get_text(self) -> None:
         """Tests :func:`smd.util.get_text` function."""
-        tags = ['<p>h&eacute;llo\n<b>world</b>\n&ntilde;<i><!---c---></i></p>',
-                '<p>\n\nhell&oacute;\n <a href="#">&lt;again&gt</a>\n\n\n</p>']
-        exp_texts = ['héllo world ñ', 'helló  <again>']
-        for tag, exp_text in zip(tags, exp_texts):
-            with self.subTest(tag=tag):
-                text = smd.utils.get_text(BeautifulSoup(tag, 'html.parser'))
-                self.assertEqual(text, exp_text)
+        tag = '<p>h&eacute;llo\n<b>world</b>\n&ntilde;<i><!---c---></i></p>'
+        text = smd.utils.get_text(BeautifulSoup(tag, 'html.parser'))
+        self.assertEqual(text, 'héllo world ñ')
+        tag = '<p>\n\nhell&oacute;\n <a href="#">&lt;again&gt</a>\n\n\n</p>'
+        text = smd.utils.get_text(BeautifulSoup(tag, 'html.parser'))
+        self.assertEqual(text, 'helló  <again>')
 
     def test_mkdir(self) -> None:
         """Tests :func:`smd.util.mkdir` function."""
-        sys.stdin = StringIO('td\ntd2\ntd3\n')
+        feed_stdin(self, 'td\ntd2\ntd3\n')
         test_dir = 'test_mkdir'
         dirs = [test_dir, test_dir, 'test\\/mkdir', 'test[>:-/]mkdir']
-        for d in dirs:
-            with self.subTest(d=d):
-                smd.utils.mkdir('.', d)
-        self.assertTrue(os.path.isdir(test_dir))
+        paths = [smd.utils.mkdir(self.test_dir, d) for d in dirs]
+        # the repeated and invalid names are replaced with the ones in stdin
+        exp_paths = [os.path.join(self.test_dir, d)
+                     for d in (test_dir, 'td', 'td2', 'td3')]
+        self.assertEqual(paths, exp_paths)
+        self.assertEqual([p for p in paths if not os.path.isdir(p)], [])
         self.assertEqual(sys.stdin.read(), '')
 
     def test_persistent_operation(self) -> None:
@@ -427,18 +421,22 @@ class TestFunctions(unittest.TestCase):
 
     def test_select_chapters(self) -> None:
         """Tests :func:`smd.util.select_chapters` function."""
-        with open(os.path.join(self.data_dir, 'chapters.json')) as data_fh:
-            chapters = [smd.utils.Chapter('', title, url) for title, url
-                        in json.load(data_fh)]
+        chapters = [smd.utils.Chapter('', title, url) for title, url
+                    in load_json(self.data_dir, 'chapters.json')]
         selectors = ['1:10', '-1', '!-3', '1,3,5', ':5, !3, 7:, !9:10']
         exp_values = [chapters[:10], [chapters[-1]],
                       chapters[:-3] + chapters[-2:],
                       [chapters[0], chapters[2], chapters[4]],
                       chapters[:2]+chapters[3:5]+chapters[6:8]+chapters[10:]]
         for selector, exp in zip(selectors, exp_values):
-            with self.subTest(selector=selector):
-                selec = smd.utils.select_chapters(chapters, selector)
-                self.assertEqual(selec, exp)
+            selec = smd.utils.select_chapters(chapters, selector)
+            self.assertEqual(selec, exp, selector)
+
+    def test_fail_select_chapters(self) -> None:
+        """Tests :func:`smd.util.select_chapters` function with invalid
+        selectors."""
+        chapters = [smd.utils.Chapter('', title, url) for title, url
+                    in load_json(self.data_dir, 'chapters.json')]
         selectors = ['1:0', 'inject_code()', '1000']
         for selector in selectors:
             with self.subTest(selector=selector):
@@ -450,12 +448,12 @@ class TestFunctions(unittest.TestCase):
         i = 1
         mangas = [smd.utils.Manga('path', title, 'url', 'site')
                   for title in 'm1 m2 m3'.split()]
-        sys.stdin = StringIO("{}\n{}\n{}".format(len(mangas)+1, -1, i))
+        feed_stdin(self, "{}\n{}\n{}".format(len(mangas)+1, -1, i))
         smangas = smd.utils.select_mangas(mangas, multiple=False)
         exp_mangas = [mangas[i-1]]
         self.assertEqual(smangas, exp_mangas)
         self.assertEqual(sys.stdin.read(), '')
-        sys.stdin = StringIO("{},{}".format(len(mangas), i))
+        feed_stdin(self, "{},{}".format(len(mangas), i))
         exp_mangas = [mangas[-1], mangas[i-1]]
         smangas = smd.utils.select_mangas(mangas)
         self.assertEqual(smangas, exp_mangas)